@@ -1,22 +1,41 @@
+import json
+import queue
 import sqlite3
+import sys
+import threading
+from bisect import bisect
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from itertools import islice
 import tkinter as tk
 from tkinter import simpledialog, scrolledtext, messagebox
-from pygments import highlight
-from pygments.lexers import get_lexer_by_name, guess_lexer
-from pygments.formatters import HtmlFormatter
 
 
 # --- 1. Data Model and Database (SQLite) ---
+# Kept as a single constant so every insert hits the connection's prepared-statement cache.
+_INSERT_SQL = "INSERT INTO snippets (title, code, language, tags, description) VALUES (?, ?, ?, ?, ?)"
+# Inserts every object of a JSON array bound as the single parameter, in one statement
+_INSERT_JSON_SQL = """
+    INSERT INTO snippets (title, code, language, tags, description)
+    SELECT json_extract(value, '$.title'), json_extract(value, '$.code'), json_extract(value, '$.language'),
+           json_extract(value, '$.tags'), json_extract(value, '$.description')
+    FROM json_each(?)
+"""
+# Explicit column list used by every full-row read (rows are mapped onto Snippet fields by name).
+_SNIPPET_COLUMNS = "id, title, code, language, tags, description"
+
+
+@dataclass(slots=True)
 class Snippet:
     """Represents a single code snippet."""
 
-    def __init__(self, title, code, language="text", tags="", description="", id=None):
-        self.id = id
-        self.title = title
-        self.code = code
-        self.language = language
-        self.tags = tags
-        self.description = description
+    title: str
+    code: str
+    language: str = "text"
+    tags: str = ""
+    description: str = ""
+    id: int | None = None
 
     def to_tuple(self):
         """Returns data in a tuple format for DB insertion/update."""
@@ -30,68 +49,395 @@ class SnippetDatabase:
     """Manages CRUD operations with the SQLite database."""
 
     def __init__(self, db_name="snippets.db"):
-        self.conn = sqlite3.connect(db_name)
+        self.conn = sqlite3.connect(db_name, cached_statements=256, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        # WAL keeps its -wal/-shm files next to the database, so the directory must be writable.
+        self.conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-20000;
+            PRAGMA mmap_size=268435456;
+        """)
         self.cursor = self.conn.cursor()
         self.create_table()
 
+    @contextmanager
+    def transaction(self):
+        """
+        Runs the enclosed statements in one explicit BEGIN IMMEDIATE ... COMMIT transaction.
+        The connection is in autocommit mode (isolation_level=None), so statements outside
+        this block commit on their own and the driver never opens transactions implicitly.
+        """
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
+
     def create_table(self):
         """Creates the snippets table if it doesn't exist."""
-        self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS snippets (
-                id INTEGER PRIMARY KEY,
-                title TEXT NOT NULL,
-                code TEXT NOT NULL,
-                language TEXT,
-                tags TEXT,
-                description TEXT
-            )
-        """)
-        self.conn.commit()
+        with self.transaction():
+            self.cursor.execute("""
+                CREATE TABLE IF NOT EXISTS snippets (
+                    id INTEGER PRIMARY KEY,
+                    title TEXT NOT NULL,
+                    code TEXT NOT NULL,
+                    language TEXT,
+                    tags TEXT,
+                    description TEXT,
+                    highlighted_html TEXT
+                )
+            """)
+            # Migration: databases created before the rendered-HTML cache column existed
+            self.cursor.execute("PRAGMA table_info(snippets)")
+            if "highlighted_html" not in {row['name'] for row in self.cursor.fetchall()}:
+                self.cursor.execute("ALTER TABLE snippets ADD COLUMN highlighted_html TEXT")
+            self.cursor.execute("CREATE INDEX IF NOT EXISTS idx_snippets_language ON snippets(language)")
+            self.cursor.execute("CREATE INDEX IF NOT EXISTS idx_snippets_title ON snippets(title)")
+
+            # Full-text index over the searchable columns, kept in sync by triggers.
+            self.cursor.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='snippets_fts'")
+            fts_exists = self.cursor.fetchone() is not None
+            self.cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS snippets_fts USING fts5(
+                    title, code, tags, description,
+                    content='snippets', content_rowid='id'
+                )
+            """)
+            self.cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS snippets_ai AFTER INSERT ON snippets BEGIN
+                    INSERT INTO snippets_fts(rowid, title, code, tags, description)
+                    VALUES (new.id, new.title, new.code, new.tags, new.description);
+                END
+            """)
+            self.cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS snippets_ad AFTER DELETE ON snippets BEGIN
+                    INSERT INTO snippets_fts(snippets_fts, rowid, title, code, tags, description)
+                    VALUES ('delete', old.id, old.title, old.code, old.tags, old.description);
+                END
+            """)
+            self.cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS snippets_au AFTER UPDATE OF title, code, tags, description ON snippets BEGIN
+                    INSERT INTO snippets_fts(snippets_fts, rowid, title, code, tags, description)
+                    VALUES ('delete', old.id, old.title, old.code, old.tags, old.description);
+                    INSERT INTO snippets_fts(rowid, title, code, tags, description)
+                    VALUES (new.id, new.title, new.code, new.tags, new.description);
+                END
+            """)
+            if not fts_exists:
+                # One-time backfill for databases created before the index existed
+                self.cursor.execute("INSERT INTO snippets_fts(snippets_fts) VALUES ('rebuild')")
+
+    @staticmethod
+    def _snippet_from_row(row):
+        """Builds a Snippet from a sqlite3.Row selected with _SNIPPET_COLUMNS."""
+        # Languages and tag lists repeat across many rows, so share one str object per distinct value
+        tags = row['tags']
+        return Snippet(id=row['id'], title=row['title'], code=row['code'],
+                       language=sys.intern(row['language'] or "text"),
+                       tags=sys.intern(tags) if tags else tags, description=row['description'])
 
     def add_snippet(self, snippet):
-        """Adds a new snippet to the database."""
-        self.cursor.execute("INSERT INTO snippets (title, code, language, tags, description) VALUES (?, ?, ?, ?, ?)",
-                            snippet.to_tuple())
-        self.conn.commit()
+        """Adds a new snippet to the database (its highlighted HTML is rendered lazily on first read)."""
+        # A single statement (and its FTS trigger) is atomic in autocommit mode
+        cursor = self.conn.execute(_INSERT_SQL, snippet.to_tuple())
+        snippet.id = cursor.lastrowid
+        return snippet.id
+
+    def add_snippets(self, snippets, chunk_size=10000):
+        """Adds many snippets in a single transaction (one commit for the whole batch)."""
+        snippets = iter(snippets)
+        with self.transaction():
+            while True:
+                chunk = [snippet.to_tuple() for snippet in islice(snippets, chunk_size)]
+                if not chunk:
+                    break
+                self.cursor.executemany(_INSERT_SQL, chunk)
+
+    def add_snippets_json(self, snippets):
+        """
+        Adds many snippets with a single INSERT ... SELECT over json_each, binding one JSON parameter.
+        Meant for bulk imports: one statement and one plan, with no per-row bind cycle.
+        Returns the number of inserted rows.
+        """
+        columns = ("title", "code", "language", "tags", "description")
+        payload = json.dumps([dict(zip(columns, snippet.to_tuple())) for snippet in snippets])
+        return self.conn.execute(_INSERT_JSON_SQL, (payload,)).rowcount
+
+    def list_snippet_headers(self, limit=-1, after=None):
+        """
+        Retrieves lightweight (id, language, title) rows ordered by title, without code bodies.
+        Pass limit and the (title, id) of the last row already seen as `after` to fetch the next page
+        (a negative limit means no limit). Keyset paging stays correct while rows are added/deleted.
+        """
+        if after is None:
+            self.cursor.execute("SELECT id, language, title FROM snippets ORDER BY title, id LIMIT ?", (limit,))
+        else:
+            self.cursor.execute("SELECT id, language, title FROM snippets WHERE (title, id) > (?, ?) "
+                                "ORDER BY title, id LIMIT ?", (*after, limit))
+        return [(row['id'], sys.intern(row['language'] or "text"), row['title']) for row in self.cursor.fetchall()]
+
+    def delete_snippet(self, snippet_id):
+        """Deletes a snippet by id."""
+        self.delete_snippets([snippet_id])
+
+    def delete_snippets(self, snippet_ids):
+        """
+        Deletes several snippets by id with a single statement. The ids are bound as one JSON array
+        (expanded with json_each), so any number of them stays under SQLite's bound-parameter limit.
+        """
+        snippet_ids = list(snippet_ids)
+        if snippet_ids:
+            self.cursor.execute("DELETE FROM snippets WHERE id IN (SELECT value FROM json_each(?))",
+                                (json.dumps(snippet_ids),))
+
+    def get_snippet(self, snippet_id):
+        """Retrieves a single full Snippet by id, or None if it no longer exists."""
+        self.cursor.execute(f"SELECT {_SNIPPET_COLUMNS} FROM snippets WHERE id=?", (snippet_id,))
+        row = self.cursor.fetchone()
+        if row is None:
+            return None
+        return self._snippet_from_row(row)
+
+    def iter_snippets(self):
+        """Yields every snippet as a Snippet object, streaming rows from the cursor."""
+        # A dedicated cursor, so other queries made while iterating don't reset this one
+        for row in self.conn.execute(f"SELECT {_SNIPPET_COLUMNS} FROM snippets"):
+            yield self._snippet_from_row(row)
 
     def get_all_snippets(self):
         """Retrieves all snippets as a list of Snippet objects."""
-        self.cursor.execute("SELECT * FROM snippets")
-        rows = self.cursor.fetchall()
-        return [Snippet(id=row[0], title=row[1], code=row[2], language=row[3], tags=row[4], description=row[5]) for row
-                in rows]
+        return list(self.iter_snippets())
+
+    def get_highlighted_html(self, snippet_id):
+        """Returns the cached highlighted HTML for a snippet, rendering and storing it if missing."""
+        self.cursor.execute("SELECT highlighted_html, code, language FROM snippets WHERE id=?", (snippet_id,))
+        row = self.cursor.fetchone()
+        if row is None:
+            return None
+        html, code, language = row
+        if html is None:
+            html = highlight_code_html(code, language)
+            self.cursor.execute("UPDATE snippets SET highlighted_html=? WHERE id=?", (html, snippet_id))
+        return html
+
+    def invalidate_html(self, snippet_id):
+        """Drops the cached highlighted HTML so it is re-rendered on next access (e.g. after an edit)."""
+        self.cursor.execute("UPDATE snippets SET highlighted_html=NULL WHERE id=?", (snippet_id,))
+
+    def search_snippets(self, query):
+        """Returns snippets matching a full-text (FTS5 MATCH) query."""
+        self.cursor.execute("SELECT s.id, s.title, s.code, s.language, s.tags, s.description "
+                            "FROM snippets s JOIN snippets_fts f ON s.id = f.rowid "
+                            "WHERE snippets_fts MATCH ? ORDER BY f.rank", (query,))
+        return [self._snippet_from_row(row) for row in self.cursor.fetchall()]
 
     def close(self):
         """Closes the database connection."""
         self.conn.close()
 
 
+class DatabaseWorker:
+    """
+    Runs SnippetDatabase calls on a background thread so disk I/O never blocks the Tk main loop.
+    The connection is opened and used only inside the worker thread; results are handed back
+    through a queue that the Tk thread polls with `after`.
+    """
+
+    POLL_MS = 20
+
+    def __init__(self, master, db_name="snippets.db"):
+        self.master = master
+        self.db_name = db_name
+        self.requests = queue.Queue()
+        self.replies = queue.Queue()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        self._poll_id = self.master.after(self.POLL_MS, self._poll)
+
+    def submit(self, method, *args, callback=None, errback=None):
+        """
+        Queues db.<method>(*args), or method(db, *args) when given a function;
+        callback(result) is later called on the Tk thread. If the call fails, the error is
+        shown and errback(error) is called instead, so requesters can reset their state.
+        """
+        self.requests.put((method, args, callback, errback))
+
+    def stop(self):
+        """Finishes queued work, closes the connection and stops polling."""
+        self.requests.put(None)
+        self.thread.join()
+        try:
+            self.master.after_cancel(self._poll_id)
+        except tk.TclError:
+            pass  # The Tk interpreter is already gone after mainloop() returns
+
+    def _run(self):
+        try:
+            db, open_error = SnippetDatabase(self.db_name), None
+        except Exception as e:
+            db, open_error = None, e
+        try:
+            while (request := self.requests.get()) is not None:
+                method, args, callback, errback = request
+                if open_error is not None:
+                    # Keep consuming requests so every requester hears about the failure
+                    self.replies.put((None, errback, None, open_error))
+                    continue
+                try:
+                    func = getattr(db, method) if isinstance(method, str) else partial(method, db)
+                    self.replies.put((callback, errback, func(*args), None))
+                except Exception as e:
+                    self.replies.put((None, errback, None, e))
+        finally:
+            if db is not None:
+                db.close()
+
+    def _poll(self):
+        try:
+            while True:
+                try:
+                    callback, errback, result, error = self.replies.get_nowait()
+                except queue.Empty:
+                    break
+                if error is not None:
+                    messagebox.showerror("Database Error", str(error))
+                    if errback is not None:
+                        errback(error)
+                elif callback is not None:
+                    callback(result)
+        finally:
+            # Always reschedule: a failing callback (reported by Tk) must not stop later replies
+            self._poll_id = self.master.after(self.POLL_MS, self._poll)
+
+
 # --- 2. Syntax Highlighting Tool (Pygments) ---
+# Pygments is imported lazily inside these helpers: loading its lexer mapping is slow
+# and the initial window doesn't highlight anything.
+@lru_cache(maxsize=None)
+def _get_html_formatter():
+    """Builds the shared HTML formatter on first use."""
+    from pygments.formatters import HtmlFormatter
+    return HtmlFormatter(style='default', full=False)
+
+
+@lru_cache(maxsize=None)
+def _get_lexer_alias_map():
+    """Builds the {alias: lexer name} reverse map from Pygments' registry, once."""
+    from pygments.lexers import get_all_lexers
+    return {alias: name for name, aliases, _filenames, _mimetypes in get_all_lexers() for alias in aliases}
+
+
+@lru_cache(maxsize=64)
+def _get_lexer(language, verbatim=False):
+    """
+    Resolves (once per language) the Pygments lexer, falling back to plain text.
+    A verbatim lexer keeps the code exactly as stored (no whitespace stripping, no added newline).
+    """
+    from pygments.lexers import find_lexer_class
+    from pygments.lexers.special import TextLexer
+    # Every snippet carries an explicit language, so never fall back to the (very slow) guess_lexer
+    name = _get_lexer_alias_map().get((language or "").lower())
+    lexer_class = (find_lexer_class(name) if name else None) or TextLexer
+    if verbatim:
+        return lexer_class(stripnl=False, ensurenl=False)
+    return lexer_class(stripall=True)
+
+
+# Tk text tags used to colour the token stream, with their foreground colours (first match wins)
+_TK_TOKEN_COLOURS = {"Comment": "#3d7b7b", "String": "#ba2121", "Number": "#666666", "Keyword": "#008000"}
+
+
+@lru_cache(maxsize=None)
+def _tk_tag_for(ttype):
+    """Maps a Pygments token type onto one of the _TK_TOKEN_COLOURS tags ('' if unstyled)."""
+    from pygments import token
+    for tag in _TK_TOKEN_COLOURS:
+        if ttype in getattr(token, tag):
+            return tag
+    return ""
+
+
+def highlight_code_tk(code, language):
+    """
+    Tokenizes the code with Pygments and returns Text.insert() arguments (chars, tag, chars, tag, ...),
+    merging neighbouring tokens with the same tag so the whole snippet goes in with one insert call.
+    """
+    chunks = []
+    run, run_tag = [], None
+    for ttype, value in _get_lexer(language, verbatim=True).get_tokens(code):
+        tag = _tk_tag_for(ttype)
+        if tag != run_tag and run:
+            # Join each run once; growing a str token by token would be quadratic in its length
+            chunks += ["".join(run), run_tag]
+            run = []
+        run.append(value)
+        run_tag = tag
+    if run:
+        chunks += ["".join(run), run_tag]
+    return chunks
+
+
 def highlight_code_html(code, language):
     """
     Highlights the code using Pygments and returns the HTML output.
     This is what you'd display in a web-view component of a modern GUI.
     For basic Tkinter, we'll simplify the highlighting (see manager class).
     """
-    try:
-        lexer = get_lexer_by_name(language, stripall=True)
-    except Exception:
-        # Fallback to guessing the language or plain text
-        try:
-            lexer = guess_lexer(code)
-        except Exception:
-            lexer = get_lexer_by_name('text', stripall=True)
+    from pygments import highlight
 
-    formatter = HtmlFormatter(style='default', full=False)
+    lexer = _get_lexer(language)
     # Returns the highlighted HTML string
-    return highlight(code, lexer, formatter)
+    return highlight(code, lexer, _get_html_formatter())
 
 
 # --- 3. Basic GUI Structure (Tkinter) ---
+@contextmanager
+def _replacing_text(widget):
+    """Unlocks a read-only Text widget, clears it for new content and locks it again afterwards."""
+    widget.config(state=tk.NORMAL)
+    try:
+        widget.delete('1.0', tk.END)
+        yield widget
+    finally:
+        widget.config(state=tk.DISABLED)
+
+
+@lru_cache(maxsize=None)
+def _language_badge(language):
+    """Returns the "[PYTHON]" style listbox prefix, computed once per language."""
+    return f"[{language.upper()}]"
+
+
+def _listbox_label(language, title):
+    """Formats a snippet header as its listbox entry, e.g. "[PYTHON] Quick sort"."""
+    return f"{_language_badge(language)} {title}"
+
+
+def _load_snippet_for_display(db, snippet_id, is_current):
+    """
+    Worker-side: fetches a snippet and tokenizes its code, so large snippets don't stall the UI.
+    Skips the work (returning None) once is_current() reports a newer selection has superseded it.
+    """
+    if not is_current():
+        return None
+    snippet = db.get_snippet(snippet_id)
+    if snippet is None:
+        return None
+    return snippet, highlight_code_tk(snippet.code, snippet.language)
+
+
 class SnippetManagerApp:
+    # Number of snippet headers fetched per page as the listbox is scrolled
+    PAGE_SIZE = 100
+
     def __init__(self, master):
-        self.db = SnippetDatabase()
         self.master = master
+        self.worker = DatabaseWorker(master)
+        self.display_generation = 0
         master.title("📝 Python Code Snippet Manager")
         master.geometry("800x600")
 
@@ -108,7 +454,8 @@ class SnippetManagerApp:
         # Snippet List
         tk.Label(self.list_frame, text="**Saved Snippets**", font='Arial 12 bold').pack(pady=5)
 
-        self.snippet_listbox = tk.Listbox(self.list_frame, width=35, height=25)
+        self.snippet_listbox = tk.Listbox(self.list_frame, width=35, height=25, selectmode=tk.EXTENDED,
+                                          yscrollcommand=self.on_listbox_scroll)
         self.snippet_listbox.pack()
         self.snippet_listbox.bind('<<ListboxSelect>>', self.show_snippet_details)
 
@@ -124,39 +471,78 @@ class SnippetManagerApp:
         # Display Area for highlighted code (using a simple ScrolledText for now)
         self.code_display = scrolledtext.ScrolledText(self.detail_frame, wrap=tk.WORD, state=tk.DISABLED, height=10)
         self.code_display.pack(fill=tk.BOTH, expand=True)
+        for tag, colour in _TK_TOKEN_COLOURS.items():
+            self.code_display.tag_configure(tag, foreground=colour)
         tk.Label(self.detail_frame,
-                 text="*Note: Full syntax highlighting is complex in native Tkinter, a web-view component (e.g., in PyQt/Kivy) is ideal for it.*").pack(
+                 text="*Note: Only basic token colouring is shown here, a web-view component (e.g., in PyQt/Kivy) can render the full Pygments HTML.*").pack(
             pady=5)
 
         self.load_snippets()
 
     def load_snippets(self):
-        """Loads snippets from the DB and populates the listbox."""
-        self.snippets = self.db.get_all_snippets()
+        """Resets the listbox and loads the first page of snippet headers from the DB."""
+        self.snippets = []
+        self.all_snippets_loaded = False
+        self.page_request_pending = False
         self.snippet_listbox.delete(0, tk.END)
-        for snippet in self.snippets:
-            self.snippet_listbox.insert(tk.END, f"[{snippet.language.upper()}] {snippet.title}")
+        self.load_next_page()
+
+    def load_next_page(self):
+        """Requests the next page of snippet headers, if any remain and none is already on its way."""
+        if self.all_snippets_loaded or self.page_request_pending:
+            return
+        self.page_request_pending = True
+        after = (self.snippets[-1][2], self.snippets[-1][0]) if self.snippets else None
+        self.worker.submit("list_snippet_headers", self.PAGE_SIZE, after, callback=self._append_page,
+                           errback=self._page_failed)
+
+    def _page_failed(self, error):
+        # Allow the next scroll to retry instead of leaving paging stuck
+        self.page_request_pending = False
+
+    def _append_page(self, page):
+        self.page_request_pending = False
+        self.all_snippets_loaded = len(page) < self.PAGE_SIZE
+        # One multi-element insert (a single Tcl call) for the whole page
+        self.snippet_listbox.insert(tk.END, *(_listbox_label(language, title) for _, language, title in page))
+        self.snippets.extend(page)
+
+    def on_listbox_scroll(self, first, last):
+        """Fetches another page once the listbox view nears the end of the loaded rows."""
+        if not self.all_snippets_loaded and float(last) >= 0.9:
+            self.master.after_idle(self.load_next_page)
+
+    def selected_snippet_id(self):
+        """Returns the id of the currently selected snippet, or None."""
+        selection = self.snippet_listbox.curselection()
+        return self.snippets[selection[0]][0] if selection else None
 
     def show_snippet_details(self, event):
-        """Displays the selected snippet's details and (basic) highlighted code."""
-        try:
-            selected_index = self.snippet_listbox.curselection()[0]
-            snippet = self.snippets[selected_index]
-
-            self.code_display.config(state=tk.NORMAL)
-            self.code_display.delete('1.0', tk.END)
-
-            # --- Simplistic Highlighting for Tkinter ---
-            # Native Tkinter doesn't easily support the HTML generated by Pygments.
-            # For a quick fix, we just display the code and title/desc.
-
-            details = f"Title: {snippet.title}\nLanguage: {snippet.language}\nTags: {snippet.tags}\nDescription:\n{snippet.description}\n\n--- CODE ---\n{snippet.code}"
-            self.code_display.insert(tk.END, details)
-
-            self.code_display.config(state=tk.DISABLED)
-
-        except IndexError:
-            pass  # No item selected
+        """Requests the selected snippet; its code and description are only fetched on selection."""
+        snippet_id = self.selected_snippet_id()
+        if snippet_id is not None:
+            # Queued requests for earlier selections see a stale generation and skip their work
+            self.display_generation += 1
+            generation = self.display_generation
+            self.worker.submit(_load_snippet_for_display, snippet_id,
+                               lambda: generation == self.display_generation, callback=self._display_snippet)
+
+    def _display_snippet(self, result):
+        """Displays the snippet's details and (basic) highlighted code, if it is still selected."""
+        if result is None:
+            return
+        snippet, code_chunks = result
+        if snippet.id != self.selected_snippet_id():
+            return
+
+        # --- Basic Highlighting for Tkinter ---
+        # Native Tkinter can't render the HTML generated by Pygments, so the token stream is
+        # mapped straight onto Text tags instead (no intermediate HTML string).
+
+        details = f"Title: {snippet.title}\nLanguage: {snippet.language}\nTags: {snippet.tags}\nDescription:\n{snippet.description}\n\n--- CODE ---\n"
+        with _replacing_text(self.code_display):
+            # Header and coloured code chunks go in with a single Tk insert call
+            self.code_display.insert('1.0', details, "", *code_chunks)
 
     def add_new_snippet(self):
         """Opens a dialog to collect new snippet data."""
@@ -174,28 +560,47 @@ class SnippetManagerApp:
         description = simpledialog.askstring("Input", "Enter Description:", parent=self.master)
 
         new_snippet = Snippet(title, code, language, tags, description)
-        self.db.add_snippet(new_snippet)
-        self.load_snippets()
+        self.worker.submit("add_snippet", new_snippet,
+                           callback=lambda snippet_id: self._snippet_added(snippet_id, language, title))
+
+    def _snippet_added(self, snippet_id, language, title):
+        # Only show it now if it sorts into the loaded range; otherwise a later page will fetch it
+        index = bisect(self.snippets, (title, snippet_id), key=lambda header: (header[2], header[0]))
+        if index < len(self.snippets) or self.all_snippets_loaded:
+            language = sys.intern(language)
+            self.snippets.insert(index, (snippet_id, language, title))
+            self.snippet_listbox.insert(index, _listbox_label(language, title))
         messagebox.showinfo("Success", f"Snippet '{title}' added successfully!")
 
     def delete_snippet(self):
-        """Deletes the selected snippet from the list and DB."""
-        try:
-            selected_index = self.snippet_listbox.curselection()[0]
-            snippet = self.snippets[selected_index]
+        """Deletes the selected snippet(s) from the list and DB."""
+        selection = self.snippet_listbox.curselection()
+        if not selection:
+            messagebox.showerror("Error", "Please select a snippet to delete.")
+            return
 
-            if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete '{snippet.title}'?"):
-                self.db.cursor.execute("DELETE FROM snippets WHERE id=?", (snippet.id,))
-                self.db.conn.commit()
-                self.load_snippets()
+        snippet_ids = [self.snippets[index][0] for index in selection]
+        if len(selection) == 1:
+            prompt = f"Are you sure you want to delete '{self.snippets[selection[0]][2]}'?"
+        else:
+            prompt = f"Are you sure you want to delete these {len(selection)} snippets?"
 
-                # Clear the detail view
-                self.code_display.config(state=tk.NORMAL)
-                self.code_display.delete('1.0', tk.END)
-                self.code_display.config(state=tk.DISABLED)
+        if messagebox.askyesno("Confirm Delete", prompt):
+            self.worker.submit("delete_snippets", snippet_ids,
+                               callback=lambda _: self._snippets_deleted(snippet_ids))
 
-        except IndexError:
-            messagebox.showerror("Error", "Please select a snippet to delete.")
+    def _snippets_deleted(self, snippet_ids):
+        # Look the rows up again (the list may have shifted while the delete was queued) and
+        # remove them from the end backwards so earlier indices stay valid
+        snippet_ids = set(snippet_ids)
+        for index in reversed(range(len(self.snippets))):
+            if self.snippets[index][0] in snippet_ids:
+                self.snippet_listbox.delete(index)
+                del self.snippets[index]
+
+        # Clear the detail view
+        with _replacing_text(self.code_display):
+            pass
 
 
 # --- Main Execution ---
@@ -203,4 +608,4 @@ if __name__ == '__main__':
     root = tk.Tk()
     app = SnippetManagerApp(root)
     root.mainloop()
-    app.db.close()
+    app.worker.stop()